@@ -111,3 +111,13 @@ class Game(BaseEntity):
     away_score: int = 0
     line: str | None = None
     over_under: float = 0
+
+
+class GamePackage(NamedTuple):
+    """
+    Player Stats, Team Stats and Game Info for a single game
+    """
+
+    players: list[PlayerStatistic]
+    teams: list[TeamStatistic]
+    game: Game | None
@@ -0,0 +1,132 @@
+"""
+Script for rebuilding the Statistics files from the archived raw payloads
+"""
+
+import argparse
+import logging
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from boto3 import Session
+from botocore.client import BaseClient
+
+from data.entities import Schedule
+from services.archive import ARCHIVE_SUFFIX, list_keys, read_archive
+from services.stats import GamePackageService
+from stats_puller import (
+    archive_prefix,
+    build_records,
+    create_client,
+    load_schedule,
+    write_outputs,
+)
+
+
+def read_archives(
+    client: BaseClient, bucket: str, keys: list[str], concurrency: int = 16
+) -> list[tuple[Schedule, dict]]:
+    """
+    Reads the game archives in parallel
+    :param client: S3 Client
+    :param bucket: S3 Bucket
+    :param keys: Archive keys
+    :param concurrency: Number of archives read at the same time
+    :return: List of Schedule entries and payloads
+    """
+    with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as executor:
+        return list(executor.map(lambda x: read_archive(client, bucket, x), keys))
+
+
+def reparse_schedule(
+    bucket: str, schedule_key: str, session: Session, concurrency: int = 16
+) -> None:
+    """
+    Rebuilds the Players, Games and Teams files of a Schedule file from its archives
+    :param bucket: S3 Bucket
+    :param schedule_key: Schedule File key
+    :param session: Boto session
+    :param concurrency: Number of archives read at the same time
+    :return: None
+    """
+    schedule_frame = load_schedule(bucket, schedule_key, session)
+    schedule_entries = [Schedule(**x) for x in schedule_frame.to_dicts()]
+    if not schedule_entries:
+        logging.warning('No Schedule Entries found: %s', schedule_key)
+        return
+
+    schedule = schedule_entries[0]
+    client = create_client(session)
+    keys = list_keys(client, bucket, archive_prefix(schedule_key, schedule), ARCHIVE_SUFFIX)
+    logging.info('Reparsing %s...(%s archives)', schedule_key, len(keys))
+    archives = {x[0].game_id: x for x in read_archives(client, bucket, keys, concurrency)}
+
+    player_stats: list = []
+    games: list = []
+    team_stats: list = []
+
+    # Keep the schedule order so the output rows match a stats run
+    for entry in schedule_entries:
+        if entry.game_id not in archives:
+            logging.warning('No archive found for game: %s', entry.game_id)
+            continue
+        archived, payloads = archives[entry.game_id]
+        package = GamePackageService.parse_game_package(entry.game_id, payloads)
+        players, game, teams = build_records(archived, package)
+        player_stats.extend(players)
+        games.extend(game)
+        team_stats.extend(teams)
+
+    write_outputs(bucket, schedule_key, schedule, (player_stats, games, team_stats), session)
+
+
+def main(
+    bucket: str,
+    *,
+    schedule_keys: list[str] | None = None,
+    prefix: str | None = None,
+    concurrency: int = 16,
+) -> None:
+    """
+    Rebuilds the Statistics files for the Schedule files from their raw payload archives
+    :param bucket: S3 Bucket
+    :keyword schedule_keys: Schedule File keys
+    :keyword prefix: S3 Prefix of Schedule files to reparse
+    :keyword concurrency: Number of archives read at the same time
+    :return: None
+    """
+
+    if not bucket or not (schedule_keys or prefix):
+        logging.error('Bucket and Schedule Keys or Prefix are required')
+        sys.exit(1)
+
+    session = Session(region_name='us-east-1')
+    keys = list(schedule_keys or [])
+    if prefix:
+        keys.extend(list_keys(create_client(session), bucket, prefix, '.parquet'))
+
+    for key in keys:
+        reparse_schedule(bucket, key, session, concurrency)
+    logging.info('DONE')
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    logging.getLogger('botocore').setLevel(logging.FATAL)
+    logging.getLogger('boto3').setLevel(logging.FATAL)
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-b', '--bucket', type=str, required=True, help='S3 Bucket')
+    parser.add_argument(
+        '-s', '--schedule_key', type=str, action='append', help='Schedule File Key'
+    )
+    parser.add_argument('-p', '--prefix', type=str, required=False, help='Schedule Files Prefix')
+    parser.add_argument(
+        '-c', '--concurrency', type=int, required=False, default=16, help='Archives read at once'
+    )
+    args = parser.parse_args()
+    main(
+        args.bucket,
+        schedule_keys=args.schedule_key,
+        prefix=args.prefix,
+        concurrency=args.concurrency,
+    )
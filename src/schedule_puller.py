@@ -17,6 +17,7 @@ from botocore.client import BaseClient
 from botocore.exceptions import ClientError
 
 from data.entities import Schedule
+from services.browser import close_browser_pool
 from services.stats import ScheduleService
 
 
@@ -123,7 +124,12 @@ def main(
     logging.info('Retrieving Schedule....(%s)', base_url)
     service = ScheduleService(base_url)
     session = Session(region_name='us-east-1')
-    results = service.get_schedule(week=week, year=year, game_type=season, group=group, date=date)
+    try:
+        results = service.get_schedule(
+            week=week, year=year, game_type=season, group=group, date=date
+        )
+    finally:
+        close_browser_pool()
     if not results:
         logging.warning('No Schedule Entries found.')
         sys.exit(0)
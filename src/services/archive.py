@@ -0,0 +1,93 @@
+"""
+Raw payload archive for reprocessing games without a browser.
+"""
+
+import gzip
+import json
+import logging
+import posixpath
+
+from botocore.client import BaseClient
+from botocore.exceptions import ClientError
+
+from data.entities import Schedule
+
+ARCHIVE_SUFFIX = '.json.gz'
+
+
+def archive_key(prefix: str, game_id: str) -> str:
+    """
+    Creates the S3 Key for a game archive
+    :param prefix: Archive prefix for the schedule file
+    :param game_id: Game ID
+    :return: S3 Key
+    """
+    return posixpath.join(prefix, f'{game_id}{ARCHIVE_SUFFIX}')
+
+
+def write_archive(
+    client: BaseClient, bucket: str, prefix: str, schedule: Schedule, payloads: dict
+) -> None:
+    """
+    Writes the raw payloads of a game as compressed JSON
+    :param client: S3 Client
+    :param bucket: S3 Bucket
+    :param prefix: Archive prefix for the schedule file
+    :param schedule: Schedule entry of the game
+    :param payloads: Dictionary of payloads by page
+    :return: None
+    """
+    entry = {
+        'game_id': schedule.game_id,
+        'week': schedule.week,
+        'year': schedule.year,
+        'game_type': schedule.game_type,
+        'payloads': payloads,
+    }
+    key = archive_key(prefix, schedule.game_id)
+    try:
+        client.put_object(
+            Bucket=bucket,
+            Key=key,
+            Body=gzip.compress(json.dumps(entry).encode('utf-8')),
+            ContentType='application/json',
+            ContentEncoding='gzip',
+        )
+    except ClientError as ex:
+        logging.error('Failed to archive payloads: %s : %s', key, ex.args)
+        raise ex
+
+
+def read_archive(client: BaseClient, bucket: str, key: str) -> tuple[Schedule, dict]:
+    """
+    Reads a game archive
+    :param client: S3 Client
+    :param bucket: S3 Bucket
+    :param key: S3 Key
+    :return: Tuple of the Schedule entry and the payloads by page
+    """
+    response = client.get_object(Bucket=bucket, Key=key)
+    entry = json.loads(gzip.decompress(response['Body'].read()))
+    schedule = Schedule(
+        game_id=entry.get('game_id', ''),
+        week=entry.get('week', 0),
+        year=entry.get('year', 0),
+        game_type=entry.get('game_type', 0),
+    )
+    return schedule, entry.get('payloads', {})
+
+
+def list_keys(client: BaseClient, bucket: str, prefix: str, suffix: str = '') -> list[str]:
+    """
+    Lists the S3 Keys under the prefix
+    :param client: S3 Client
+    :param bucket: S3 Bucket
+    :param prefix: S3 Prefix
+    :param suffix: Only return keys with this suffix
+    :return: List of S3 Keys
+    """
+    keys = []
+    paginator = client.get_paginator('list_objects_v2')
+    for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+        keys.extend([x['Key'] for x in page.get('Contents', []) if x['Key'].endswith(suffix)])
+    return keys
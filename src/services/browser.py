@@ -0,0 +1,187 @@
+"""
+Browser management for the Stats Services.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+
+
+def create_browser() -> webdriver.Chrome:
+    """
+    Creates a headless Chrome Web Browser.
+    :return: Chrome Web Driver
+    """
+    options = webdriver.ChromeOptions()
+    options.add_argument('--headless')
+    options.add_argument('--ignore-certificate-errors')
+
+    if os.getenv('SELENIUM_DRIVER'):
+        service = Service(os.getenv('SELENIUM_DRIVER'))
+        return webdriver.Chrome(options=options, service=service)
+    return webdriver.Chrome(options=options)
+
+
+class BrowserPool:
+    """
+    Bounded pool of Web Browsers shared between the Stats Services.
+    Browsers are started on demand, up to the pool size.
+    """
+
+    size: int
+    logger: logging.Logger
+
+    def __init__(self, size: int = 1, factory: Callable[[], webdriver.Chrome] = create_browser):
+        """
+        Browser Pool Constructor
+        :param size: Maximum number of browsers in the pool
+        :param factory: Function used to start a new browser
+        """
+        if size < 1:
+            raise ValueError('Browser pool size must be at least 1')
+
+        self.size = size
+        self.factory = factory
+        self.logger = logging.getLogger(__name__)
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._browsers: list[webdriver.Chrome] = []
+        self._reserved = 0
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @property
+    def started(self) -> int:
+        """
+        Number of browsers currently started by the pool.
+        """
+        return len(self._browsers)
+
+    def checkout(self, timeout: float | None = None) -> webdriver.Chrome:
+        """
+        Borrows a browser from the pool, starting one if the pool is not full.
+        :param timeout: Seconds to wait for a browser to be returned. None waits forever.
+        :return: Chrome Web Driver
+        """
+        if self._closed:
+            raise RuntimeError('Browser pool is closed')
+
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            can_start = self._reserved < self.size
+            if can_start:
+                self._reserved += 1
+
+        if can_start:
+            try:
+                browser = self.factory()
+            except Exception:
+                with self._lock:
+                    self._reserved -= 1
+                raise
+            with self._lock:
+                self._browsers.append(browser)
+            self.logger.debug('Started browser %s of %s', len(self._browsers), self.size)
+            return browser
+
+        try:
+            return self._idle.get(timeout=timeout)
+        except queue.Empty as ex:
+            raise TimeoutError('Timed out waiting for a browser from the pool') from ex
+
+    def checkin(self, browser: webdriver.Chrome) -> None:
+        """
+        Returns a borrowed browser to the pool.
+        :param browser: Chrome Web Driver
+        :return: None
+        """
+        if self._closed:
+            self._quit_(browser)
+            return
+        self._idle.put(browser)
+
+    @contextmanager
+    def browser(self, timeout: float | None = None) -> Iterator[webdriver.Chrome]:
+        """
+        Borrows a browser for the duration of the context.
+        :param timeout: Seconds to wait for a browser to be returned.
+        :return: Chrome Web Driver
+        """
+        browser = self.checkout(timeout)
+        try:
+            yield browser
+        finally:
+            self.checkin(browser)
+
+    def close(self) -> None:
+        """
+        Quits all the browsers started by the pool.
+        :return: None
+        """
+        with self._lock:
+            self._closed = True
+            browsers = list(self._browsers)
+            self._browsers.clear()
+            self._reserved = 0
+
+        while not self._idle.empty():
+            self._idle.get_nowait()
+
+        for browser in browsers:
+            self._quit_(browser)
+
+    def _quit_(self, browser: webdriver.Chrome) -> None:
+        """
+        Quits a browser, logging any failures.
+        :param browser: Chrome Web Driver
+        :return: None
+        """
+        try:
+            browser.quit()
+        except Exception as ex:
+            self.logger.warning('Failed to quit browser: %s', ex)
+
+    def __enter__(self) -> 'BrowserPool':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+_pool: BrowserPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """
+    Returns the process wide Browser Pool, sized from BROWSER_POOL_SIZE.
+    :return: Browser Pool
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = BrowserPool(int(os.getenv('BROWSER_POOL_SIZE', '1')))
+            atexit.register(_pool.close)
+        return _pool
+
+
+def close_browser_pool() -> None:
+    """
+    Closes the process wide Browser Pool, quitting all of its browsers.
+    :return: None
+    """
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool:
+        pool.close()
@@ -0,0 +1,207 @@
+"""
+Persistent on-disk cache for the Stats Payloads.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+CACHE_SUFFIX = '.json.gz'
+
+
+class PayloadCache:
+    """
+    Compressed payload cache keyed by URL with per entry expiry and a
+    least recently used eviction policy bounded by the total size on disk.
+    """
+
+    directory: str
+    max_bytes: int
+    default_ttl: float | None
+    logger: logging.Logger
+
+    def __init__(
+        self,
+        directory: str,
+        *,
+        max_bytes: int = 1024**3,
+        default_ttl: float | None = 300,
+    ) -> None:
+        """
+        Payload Cache Constructor
+        :param directory: Cache Directory
+        :keyword max_bytes: Maximum size of the cache on disk
+        :keyword default_ttl: Seconds an entry is kept when no ttl is provided. None keeps it.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.logger = logging.getLogger(__name__)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._sizes: dict[str, int] = {}
+
+        os.makedirs(directory, exist_ok=True)
+        for name in os.listdir(directory):
+            if name.endswith(CACHE_SUFFIX):
+                self._sizes[name] = os.path.getsize(os.path.join(directory, name))
+
+    @property
+    def size(self) -> int:
+        """
+        Total size of the cache entries in bytes.
+        """
+        return sum(self._sizes.values())
+
+    def stats(self) -> dict:
+        """
+        Returns the cache counters.
+        :return: Dictionary of counters
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self._sizes),
+            'bytes': self.size,
+        }
+
+    def get(self, url: str) -> dict | None:
+        """
+        Returns the cached payload for the URL.
+        :param url: URL of the payload
+        :return: Dictionary or None when missing or expired
+        """
+        name = self._name_(url)
+        path = os.path.join(self.directory, name)
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as input_file:
+                entry = json.load(input_file)
+        except FileNotFoundError:
+            self._miss_()
+            return None
+        except (OSError, EOFError, ValueError) as ex:
+            self.logger.warning('Discarding unreadable cache entry %s: %s', name, ex)
+            self._remove_(name)
+            self._miss_()
+            return None
+
+        expires = entry.get('expires')
+        if expires is not None and expires < time.time():
+            self._remove_(name)
+            self._miss_()
+            return None
+
+        # Touch the entry so eviction removes the least recently used first
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        with self._lock:
+            self.hits += 1
+        return entry.get('payload')
+
+    def put(self, url: str, payload: dict, ttl: float | None = None) -> None:
+        """
+        Stores the payload for the URL.
+        :param url: URL of the payload
+        :param payload: Payload
+        :param ttl: Seconds to keep the entry. None keeps it until it is evicted.
+        :return: None
+        """
+        name = self._name_(url)
+        path = os.path.join(self.directory, name)
+        entry = {
+            'url': url,
+            'expires': time.time() + ttl if ttl is not None else None,
+            'payload': payload,
+        }
+        data = gzip.compress(json.dumps(entry).encode('utf-8'))
+
+        # Write to a temporary file first so readers never see a partial entry
+        temp_path = f'{path}.{threading.get_ident()}.tmp'
+        with open(temp_path, 'wb') as output_file:
+            output_file.write(data)
+        os.replace(temp_path, path)
+
+        with self._lock:
+            self._sizes[name] = len(data)
+        self._evict_()
+
+    def _evict_(self) -> None:
+        """
+        Removes the least recently used entries until the cache fits in max bytes.
+        :return: None
+        """
+        if self.size <= self.max_bytes:
+            return
+
+        entries = []
+        for name in list(self._sizes):
+            try:
+                entries.append((os.path.getmtime(os.path.join(self.directory, name)), name))
+            except FileNotFoundError:
+                self._remove_(name)
+
+        for _, name in sorted(entries):
+            if self.size <= self.max_bytes:
+                break
+            self._remove_(name)
+            with self._lock:
+                self.evictions += 1
+
+    def _remove_(self, name: str) -> None:
+        """
+        Removes a cache entry.
+        :param name: Entry file name
+        :return: None
+        """
+        with self._lock:
+            self._sizes.pop(name, None)
+        try:
+            os.remove(os.path.join(self.directory, name))
+        except FileNotFoundError:
+            pass
+
+    def _miss_(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    @staticmethod
+    def _name_(url: str) -> str:
+        """
+        Builds the entry file name for the URL.
+        :param url: URL of the payload
+        :return: File Name
+        """
+        return hashlib.sha256(url.encode('utf-8')).hexdigest() + CACHE_SUFFIX
+
+
+_cache: PayloadCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_payload_cache() -> PayloadCache | None:
+    """
+    Returns the process wide Payload Cache when PAYLOAD_CACHE_DIR is set.
+    :return: Optional Payload Cache
+    """
+    global _cache
+    directory = os.getenv('PAYLOAD_CACHE_DIR')
+    if not directory:
+        return None
+
+    with _cache_lock:
+        if _cache is None or _cache.directory != directory:
+            _cache = PayloadCache(
+                directory,
+                max_bytes=int(os.getenv('PAYLOAD_CACHE_MAX_BYTES', str(1024**3))),
+                default_ttl=float(os.getenv('PAYLOAD_CACHE_TTL', '300')),
+            )
+        return _cache
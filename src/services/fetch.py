@@ -0,0 +1,127 @@
+"""
+Browser-less retrieval of the Stats Payload from the raw page HTML.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+
+import urllib3
+from urllib3.exceptions import HTTPError
+
+PAYLOAD_PATTERN = re.compile(r'window(?:\.__espnfitt__|\[\s*[\'"]__espnfitt__[\'"]\s*\])\s*=\s*')
+
+DEFAULT_USER_AGENT = (
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) '
+    'Chrome/134.0.0.0 Safari/537.36'
+)
+
+
+def extract_payload(html: str) -> dict | None:
+    """
+    Extracts the window.__espnfitt__ object embedded in the page source.
+    :param html: Page HTML
+    :return: Dictionary or None
+    """
+    match = PAYLOAD_PATTERN.search(html)
+    if not match:
+        return None
+
+    try:
+        payload, _ = json.JSONDecoder().raw_decode(html, match.end())
+    except json.JSONDecodeError:
+        return None
+
+    if not isinstance(payload, dict):
+        return None
+    return payload
+
+
+class HttpFetcher:
+    """
+    Retrieves page HTML over a pooled HTTP connection.
+    """
+
+    http: urllib3.PoolManager
+    logger: logging.Logger
+
+    def __init__(
+        self,
+        *,
+        pool_size: int = 10,
+        timeout: float = 10.0,
+        retries: int = 2,
+        user_agent: str = DEFAULT_USER_AGENT,
+    ) -> None:
+        """
+        HTTP Fetcher Constructor
+        :keyword pool_size: Connections kept open per host
+        :keyword timeout: Read timeout in seconds
+        :keyword retries: Retries for connection failures and server errors
+        :keyword user_agent: User Agent header
+        """
+        self.http = urllib3.PoolManager(
+            maxsize=pool_size,
+            timeout=urllib3.Timeout(connect=min(timeout, 5.0), read=timeout),
+            retries=urllib3.Retry(
+                total=retries,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+                raise_on_status=False,
+            ),
+            headers={
+                'User-Agent': user_agent,
+                'Accept': 'text/html,application/xhtml+xml',
+                'Accept-Encoding': 'gzip, deflate',
+            },
+        )
+        self.logger = logging.getLogger(__name__)
+
+    def get_html(self, url: str) -> str | None:
+        """
+        Retrieves the HTML for the provided URL.
+        :param url: URL to request
+        :return: Page HTML or None
+        """
+        try:
+            response = self.http.request('GET', url)
+        except HTTPError as ex:
+            self.logger.warning('Failed to retrieve %s: %s', url, ex)
+            return None
+
+        if response.status != 200:
+            self.logger.warning('Failed to retrieve %s: HTTP %s', url, response.status)
+            return None
+        return response.data.decode('utf-8', errors='replace')
+
+    def get_stats_payload(self, url: str) -> dict | None:
+        """
+        Retrieves the Stats Payload from the page source of the provided URL.
+        :param url: URL to request
+        :return: Dictionary or None
+        """
+        html = self.get_html(url)
+        if not html:
+            return None
+        return extract_payload(html)
+
+
+_fetcher: HttpFetcher | None = None
+_fetcher_lock = threading.Lock()
+
+
+def get_http_fetcher() -> HttpFetcher:
+    """
+    Returns the process wide HTTP Fetcher.
+    :return: HTTP Fetcher
+    """
+    global _fetcher
+    with _fetcher_lock:
+        if _fetcher is None:
+            _fetcher = HttpFetcher(
+                pool_size=int(os.getenv('HTTP_POOL_SIZE', '10')),
+                user_agent=os.getenv('HTTP_USER_AGENT', DEFAULT_USER_AGENT),
+            )
+        return _fetcher
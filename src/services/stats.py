@@ -7,10 +7,19 @@ import os
 import posixpath
 import re
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
+from data.entities import (
+    BaseStatistic,
+    Game,
+    GamePackage,
+    PlayerStatistic,
+    Schedule,
+    TeamStatistic,
+)
+from services.browser import BrowserPool, get_browser_pool
+from services.cache import PayloadCache, get_payload_cache
+from services.fetch import get_http_fetcher
 
-from data.entities import BaseStatistic, Game, PlayerStatistic, Schedule, TeamStatistic
+ENGINES = ('selenium', 'http')
 
 
 class BaseService:
@@ -18,40 +27,78 @@ class BaseService:
     Base Service Class
     """
 
-    browser: webdriver.Chrome
+    pool: BrowserPool
+    cache: PayloadCache | None
     logger: logging.Logger
     base_url: str
+    engine: str
 
-    def __init__(self, base_url: str) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        pool: BrowserPool | None = None,
+        engine: str | None = None,
+        cache: PayloadCache | None = None,
+    ) -> None:
         """
-        Base Service Constructor to establish a Web Browser.
+        Base Service Constructor.
+        :param base_url: Base URL of the Stats site
+        :param pool: Browser Pool to borrow from. Defaults to the process wide pool.
+        :param engine: Fetch engine (selenium, http). Defaults to FETCH_ENGINE or selenium.
+        :param cache: Payload Cache. Defaults to the cache at PAYLOAD_CACHE_DIR, if set.
         """
         self.base_url = base_url
-        options = webdriver.ChromeOptions()
-        options.add_argument('--headless')
-        options.add_argument('--ignore-certificate-errors')
-
-        if os.getenv('SELENIUM_DRIVER'):
-            service = Service(os.getenv('SELENIUM_DRIVER'))
-            self.browser = webdriver.Chrome(options=options, service=service)
-        else:
-            self.browser = webdriver.Chrome(options=options)
+        self.pool = pool or get_browser_pool()
+        self.engine = engine or os.getenv('FETCH_ENGINE') or 'selenium'
+        if self.engine not in ENGINES:
+            raise ValueError(f'Unknown fetch engine: {self.engine}')
+        self.cache = cache or get_payload_cache()
         self.logger = logging.getLogger(__name__)
 
     def get_stats_payload(self, url: str) -> dict | None:
         """
-        Retrieves the Stats Payload from the Provided URL.
+        Retrieves the Stats Payload from the Provided URL, using the Payload Cache when set.
         :param url: URL to request.
         :return: Dictionary or None.
         """
-        self.browser.get(url)
-        return self.browser.execute_script('return window.__espnfitt__')
+        if self.cache:
+            payload = self.cache.get(url)
+            if payload:
+                return payload
+
+        payload = self._fetch_payload_(url)
+        if self.cache and payload:
+            self.cache.put(url, payload, self._cache_ttl_(payload))
+        return payload
 
-    def __del__(self):
+    def _fetch_payload_(self, url: str) -> dict | None:
         """
-        Destructor for Closing up the Selenium Web Browser.
+        Retrieves the Stats Payload from the site.
+        The http engine falls back to the browser when the payload cannot be extracted.
+        :param url: URL to request.
+        :return: Dictionary or None.
         """
-        self.browser.quit()
+        if self.engine == 'http':
+            payload = get_http_fetcher().get_stats_payload(url)
+            if payload:
+                return payload
+            self.logger.info('Falling back to the browser for %s', url)
+
+        with self.pool.browser() as browser:
+            browser.get(url)
+            return browser.execute_script('return window.__espnfitt__')
+
+    def _cache_ttl_(self, payload: dict) -> float | None:
+        """
+        Returns how long a payload is cached. Final games never change and are kept,
+        anything else uses the cache default.
+        :param payload: Stats Payload
+        :return: Seconds or None to keep the entry
+        """
+        strip = payload.get('page', {}).get('content', {}).get('gamepackage', {}).get('gmStrp', {})
+        if strip.get('statusState') == 'post':
+            return None
+        return self.cache.default_ttl if self.cache else None
 
     def _build_url_(self, parts: list[str]) -> str:
         """
@@ -100,7 +147,8 @@ class TeamService(BaseService):
     Service for retrieving Team Level Stats
     """
 
-    def _extract_stats_(self, game_id: str, team: dict, opponent: dict, stats: dict) -> list:
+    @staticmethod
+    def _extract_stats_(game_id: str, team: dict, opponent: dict, stats: dict) -> list:
         """
         Extracts the Statistics for a Team
         :param game_id: Game Id
@@ -120,20 +168,17 @@ class TeamService(BaseService):
                 opponent=opponent.get('dspNm'),
                 game_id=game_id,
             )
-            result.extend(self._explode_stat_(stat, value))
+            result.extend(BaseService._explode_stat_(stat, value))
 
         return result
 
-    def get_stats(self, game_id: str) -> list[TeamStatistic]:
+    @staticmethod
+    def parse_stats(payload: dict | None) -> list[TeamStatistic]:
         """
-        Retrieves the statistics from the provided Game ID.
-        :param game_id: Game ID
+        Extracts the Team Statistics from a matchup payload.
+        :param payload: Stats Payload
         :return: Collection of Teams Statistics
         """
-        parts = ['matchup', '_', 'gameId', game_id]
-        url = self._build_url_(parts)
-
-        payload = self.get_stats_payload(url)
         if not payload:
             return []
         game_info = (
@@ -149,21 +194,37 @@ class TeamService(BaseService):
 
         results = []
         results.extend(
-            self._extract_stats_(game_info.get('gid'), home_team, away_team, home.get('s', {}))
+            TeamService._extract_stats_(
+                game_info.get('gid'), home_team, away_team, home.get('s', {})
+            )
         )
         results.extend(
-            self._extract_stats_(game_info.get('gid'), away_team, home_team, away.get('s', {}))
+            TeamService._extract_stats_(
+                game_info.get('gid'), away_team, home_team, away.get('s', {})
+            )
         )
 
         return results
 
+    def get_stats(self, game_id: str) -> list[TeamStatistic]:
+        """
+        Retrieves the statistics from the provided Game ID.
+        :param game_id: Game ID
+        :return: Collection of Teams Statistics
+        """
+        parts = ['matchup', '_', 'gameId', game_id]
+        url = self._build_url_(parts)
+
+        return self.parse_stats(self.get_stats_payload(url))
+
 
 class PlayerService(BaseService):
     """
     Services for retrieving the Player Level Statistics
     """
 
-    def _build_stats_(self, team: dict, opponent: dict, stats: list[dict]) -> list:
+    @staticmethod
+    def _build_stats_(team: dict, opponent: dict, stats: list[dict]) -> list:
         """
         Extracts the Player stats from the object
         :param team: Team Info
@@ -191,20 +252,18 @@ class PlayerService(BaseService):
                     statistic_type=stat_type,
                 )
                 for stat_value in stat_values:
-                    result.extend(self._explode_stat_(item, stat_value))
+                    result.extend(BaseService._explode_stat_(item, stat_value))
 
         return result
 
-    def get_stats(self, game_id: str) -> list:
+    @staticmethod
+    def parse_stats(game_id: str, payload: dict | None) -> list[PlayerStatistic]:
         """
-        Retrieves the statistics for the provided Game ID.
+        Extracts the Player Statistics from a boxscore payload.
         :param game_id: Game ID
+        :param payload: Stats Payload
         :return: Collection of Players Statistics
         """
-        parts = ['boxscore', '_', 'gameId', game_id]
-        url = self._build_url_(parts)
-        payload = self.get_stats_payload(url)
-
         if not payload:
             return []
         stats = []
@@ -217,34 +276,42 @@ class PlayerService(BaseService):
         home_stats = bxscore[1]
 
         stats.extend(
-            self._build_stats_(
+            PlayerService._build_stats_(
                 away_stats.get('tm', {}), home_stats.get('tm', {}), away_stats.get('stats', [])
             )
         )
         stats.extend(
-            self._build_stats_(
+            PlayerService._build_stats_(
                 home_stats.get('tm', {}), away_stats.get('tm', {}), home_stats.get('stats', [])
             )
         )
         return [x.copy(update={'game_id': game_id}) for x in stats]
 
+    def get_stats(self, game_id: str) -> list:
+        """
+        Retrieves the statistics for the provided Game ID.
+        :param game_id: Game ID
+        :return: Collection of Players Statistics
+        """
+        parts = ['boxscore', '_', 'gameId', game_id]
+        url = self._build_url_(parts)
+
+        return self.parse_stats(game_id, self.get_stats_payload(url))
+
 
 class GameService(BaseService):
     """
     Service for retrieving the Game Level Information
     """
 
-    def get_game_info(self, game_id: str) -> Game | None:
+    @staticmethod
+    def parse_game_info(game_id: str, payload: dict | None) -> Game | None:
         """
-        Retrieves the Game Info from the provided Game ID.
+        Extracts the Game Info from a boxscore or matchup payload.
         :param game_id: Game ID
+        :param payload: Stats Payload
         :return: Optional Game
         """
-
-        parts = ['matchup', '_', 'gameId', game_id]
-        url = self._build_url_(parts)
-
-        payload = self.get_stats_payload(url)
         if not payload:
             return None
 
@@ -273,6 +340,66 @@ class GameService(BaseService):
             over_under=float(gm_info.get('ovUnd', 0)),
         )
 
+    def get_game_info(self, game_id: str) -> Game | None:
+        """
+        Retrieves the Game Info from the provided Game ID.
+        :param game_id: Game ID
+        :return: Optional Game
+        """
+
+        parts = ['matchup', '_', 'gameId', game_id]
+        url = self._build_url_(parts)
+
+        return self.parse_game_info(game_id, self.get_stats_payload(url))
+
+
+class GamePackageService(BaseService):
+    """
+    Service for retrieving the Player Stats, Team Stats and Game Info of a game
+    with one navigation per page. The boxscore page carries the players and game
+    info, the matchup page carries the team stats.
+    """
+
+    def get_game_payloads(self, game_id: str) -> dict:
+        """
+        Retrieves the raw boxscore and matchup payloads for the provided Game ID.
+        :param game_id: Game ID
+        :return: Dictionary of payloads by page
+        """
+        return {
+            page: self.get_stats_payload(self._build_url_([page, '_', 'gameId', game_id]))
+            for page in ('boxscore', 'matchup')
+        }
+
+    @staticmethod
+    def parse_game_package(game_id: str, payloads: dict) -> GamePackage:
+        """
+        Builds the Game Package from the raw boxscore and matchup payloads.
+        :param game_id: Game ID
+        :param payloads: Dictionary of payloads by page
+        :return: Game Package
+        """
+        boxscore = payloads.get('boxscore')
+        matchup = payloads.get('matchup')
+
+        game = GameService.parse_game_info(game_id, boxscore)
+        if not game:
+            game = GameService.parse_game_info(game_id, matchup)
+
+        return GamePackage(
+            players=PlayerService.parse_stats(game_id, boxscore),
+            teams=TeamService.parse_stats(matchup),
+            game=game,
+        )
+
+    def get_game_package(self, game_id: str) -> GamePackage:
+        """
+        Retrieves the Game Package for the provided Game ID.
+        :param game_id: Game ID
+        :return: Game Package
+        """
+        return self.parse_game_package(game_id, self.get_game_payloads(game_id))
+
 
 class ScheduleService(BaseService):
     """
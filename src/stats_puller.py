@@ -7,6 +7,9 @@ import logging
 import os
 import posixpath
 import sys
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from io import BytesIO
 
 import polars
@@ -15,8 +18,10 @@ from botocore.client import BaseClient
 from botocore.exceptions import ClientError
 from polars import DataFrame
 
-from data.entities import Schedule
-from services.stats import GameService, PlayerService, TeamService
+from data.entities import GamePackage, Schedule
+from services.archive import write_archive
+from services.browser import BrowserPool
+from services.stats import GamePackageService
 
 
 def create_client(session: Session) -> BaseClient:
@@ -107,50 +112,102 @@ def write_output(bucket: str, key: str, records: list, session: Session) -> None
         raise ex
 
 
-def main(bucket: str, schedule_key: str) -> None:
+def archive_prefix(schedule_key: str, schedule: Schedule) -> str:
     """
-    Retrieves the Stats for the provided Schedule file
-    :param bucket: S3 Bucket for Schedule and Destination
+    Creates the S3 prefix of the raw payload archives for a Schedule file
     :param schedule_key: Schedule File key
-    :return: None
+    :param schedule: First Schedule entry for the Partitions
+    :return: S3 Prefix
     """
+    name = os.path.splitext(os.path.basename(schedule_key))[0]
+    return make_key(name, 'raw', schedule.week, schedule.year, schedule.game_type)
 
-    if not bucket or not schedule_key:
-        logging.error('Bucket and Schedule Key are required')
-        sys.exit(1)
 
-    session = Session(region_name='us-east-1')
-    schedule_frame = load_schedule(bucket, schedule_key, session)
-    schedule_entries = [Schedule(**x) for x in schedule_frame.to_dicts()]
-    base_url = os.getenv('BASE_URL', '')
-
-    player_service = PlayerService(base_url)
-    team_service = TeamService(base_url)
-    game_service = GameService(base_url)
+def build_records(schedule: Schedule, package: GamePackage) -> tuple[list, list, list]:
+    """
+    Adds the Schedule partitions to the records of a Game Package
+    :param schedule: Schedule entry
+    :param package: Game Package
+    :return: Tuple of Player Stats, Games and Team Stats
+    """
+    upd = {'week': schedule.week, 'game_type': schedule.game_type, 'year': schedule.year}
 
-    player_stats = []
-    games = []
-    team_stats = []
+    player_stats = [x.copy(update=upd) for x in package.players if x]
+    games = [x.copy(update=upd) for x in [package.game] if x]
+    team_stats = [x.copy(update=upd) for x in package.teams if x]
+    return player_stats, games, team_stats
 
-    logging.info('Retrieving Stats...(%s)', len(schedule_entries))
-    for schedule in schedule_entries:
-        upd = {'week': schedule.week, 'game_type': schedule.game_type, 'year': schedule.year}
-
-        player_stats.extend(
-            [x.copy(update=upd) for x in player_service.get_stats(schedule.game_id) if x]
-        )
-        games.extend(
-            [x.copy(update=upd) for x in [game_service.get_game_info(schedule.game_id)] if x]
-        )
-        team_stats.extend(
-            [x.copy(update=upd) for x in team_service.get_stats(schedule.game_id) if x]
-        )
 
-    # Get the first Schedule for the Partitions
-    schedule = schedule_entries[0]
+def pull_game(
+    schedule: Schedule,
+    service: GamePackageService,
+    archive: Callable[[Schedule, dict], None] | None = None,
+) -> tuple[list, list, list]:
+    """
+    Retrieves the Player Stats, Game Info and Team Stats for a Schedule entry
+    :param schedule: Schedule entry
+    :param service: Game Package Service
+    :param archive: Optional function storing the raw payloads of the game
+    :return: Tuple of Player Stats, Games and Team Stats
+    """
+    payloads = service.get_game_payloads(schedule.game_id)
+    if archive:
+        archive(schedule, payloads)
+    return build_records(schedule, service.parse_game_package(schedule.game_id, payloads))
+
+
+def pull_games(
+    schedule_entries: list[Schedule],
+    service: GamePackageService,
+    concurrency: int = 1,
+    archive: Callable[[Schedule, dict], None] | None = None,
+) -> tuple[list, list, list]:
+    """
+    Retrieves the stats for the Schedule entries using a pool of workers.
+    Results keep the schedule order and failed games are logged and skipped.
+    :param schedule_entries: Schedule entries
+    :param service: Game Package Service
+    :param concurrency: Number of games retrieved at the same time
+    :param archive: Optional function storing the raw payloads of each game
+    :return: Tuple of Player Stats, Games and Team Stats
+    """
+    player_stats: list = []
+    games: list = []
+    team_stats: list = []
+
+    with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as executor:
+        futures = [executor.submit(pull_game, x, service, archive) for x in schedule_entries]
+        for schedule, future in zip(schedule_entries, futures, strict=True):
+            try:
+                players, game, teams = future.result()
+            except Exception:
+                logging.exception('Failed to retrieve stats for game: %s', schedule.game_id)
+                continue
+            player_stats.extend(players)
+            games.extend(game)
+            team_stats.extend(teams)
+
+    return player_stats, games, team_stats
+
+
+def write_outputs(
+    bucket: str,
+    schedule_key: str,
+    schedule: Schedule,
+    records: tuple[list, list, list],
+    session: Session,
+) -> None:
+    """
+    Writes the Players, Games and Teams files for a Schedule file
+    :param bucket: S3 Bucket
+    :param schedule_key: Schedule File key
+    :param schedule: First Schedule entry for the Partitions
+    :param records: Tuple of Player Stats, Games and Team Stats
+    :param session: Boto session
+    :return: None
+    """
+    player_stats, games, team_stats = records
 
-    # Write the Frames
-    logging.info('Writing Output Files...')
     player_file_name = make_key(
         f'players-{os.path.basename(schedule_key)}',
         'players',
@@ -178,6 +235,46 @@ def main(bucket: str, schedule_key: str) -> None:
     )
     write_output(bucket, team_file_name, team_stats, session)
 
+
+def main(bucket: str, schedule_key: str, concurrency: int = 1, archive: bool = False) -> None:
+    """
+    Retrieves the Stats for the provided Schedule file
+    :param bucket: S3 Bucket for Schedule and Destination
+    :param schedule_key: Schedule File key
+    :param concurrency: Number of games retrieved at the same time
+    :param archive: Stores the raw payloads of each game for reprocessing
+    :return: None
+    """
+
+    if not bucket or not schedule_key:
+        logging.error('Bucket and Schedule Key are required')
+        sys.exit(1)
+
+    session = Session(region_name='us-east-1')
+    schedule_frame = load_schedule(bucket, schedule_key, session)
+    schedule_entries = [Schedule(**x) for x in schedule_frame.to_dicts()]
+    base_url = os.getenv('BASE_URL', '')
+    pool_size = max(concurrency, int(os.getenv('BROWSER_POOL_SIZE', '1')))
+
+    # Get the first Schedule for the Partitions
+    schedule = schedule_entries[0]
+
+    archiver = None
+    if archive:
+        prefix = archive_prefix(schedule_key, schedule)
+        archiver = partial(write_archive, create_client(session), bucket, prefix)
+
+    logging.info('Retrieving Stats...(%s)', len(schedule_entries))
+    with BrowserPool(pool_size) as pool:
+        service = GamePackageService(base_url, pool)
+        records = pull_games(schedule_entries, service, concurrency, archiver)
+    if service.cache:
+        logging.info('Payload Cache: %s', service.cache.stats())
+
+    # Write the Frames
+    logging.info('Writing Output Files...')
+    write_outputs(bucket, schedule_key, schedule, records, session)
+
     logging.info('DONE')
 
 
@@ -189,5 +286,16 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser()
     parser.add_argument('-b', '--bucket', type=str, required=True, help='S3 Bucket')
     parser.add_argument('-s', '--schedule_key', type=str, required=True, help='Schedule File Key')
+    parser.add_argument(
+        '-c', '--concurrency', type=int, required=False, default=1, help='Games pulled at once'
+    )
+    parser.add_argument(
+        '-a', '--archive', action='store_true', help='Archive the raw payloads for reparsing'
+    )
     args = parser.parse_args()
-    main(bucket=args.bucket, schedule_key=args.schedule_key)
+    main(
+        bucket=args.bucket,
+        schedule_key=args.schedule_key,
+        concurrency=args.concurrency,
+        archive=args.archive,
+    )
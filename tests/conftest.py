@@ -4,6 +4,9 @@ Pytest Fixtures
 
 import json
 import os
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 import pytest
 from boto3 import Session
@@ -121,3 +124,57 @@ def schedule_file(s3, session):
 
     client = session.client('s3')
     client.put_object(Bucket='test-bucket', Key='schedule/20241201.parquet', Body=content)
+
+
+class StatsSiteHandler(BaseHTTPRequestHandler):
+    """
+    Serves the test payloads wrapped in a HTML page
+    """
+
+    pages = {
+        'boxscore': './tests/test_files/boxscore.json',
+        'matchup': './tests/test_files/team.json',
+        'schedule': './tests/test_files/schedule.json',
+    }
+
+    def do_GET(self) -> None:
+        page = self.path.strip('/').split('/')[0]
+        if page == 'broken':
+            self._send_(200, '<html><body>No payload here</body></html>')
+            return
+        if page not in self.pages:
+            self._send_(404, '<html><body>Not Found</body></html>')
+            return
+
+        with open(self.pages[page]) as input:
+            content = input.read()
+        self._send_(
+            200,
+            f"<html><head><script>window['__espnfitt__']={content};</script></head>"
+            '<body></body></html>',
+        )
+
+    def _send_(self, status: int, body: str) -> None:
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+@pytest.fixture(scope='module')
+def stats_site() -> Iterator[str]:
+    """
+    Starts a local HTTP server serving the test payloads and returns its base url
+    """
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StatsSiteHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,68 @@
+"""
+Tests for reparsing the archived payloads
+"""
+
+from io import BytesIO
+
+import polars
+from assertpy import assert_that
+
+import reparse
+import stats_puller
+from services.stats import GamePackageService
+
+OUTPUT_KEYS = [
+    'players/2025/regular/players-20241201.parquet',
+    'games/2025/regular/games-20241201.parquet',
+    'teams/2025/regular/teams-20241201.parquet',
+]
+
+
+def _read_outputs(client) -> list[polars.DataFrame]:
+    return [
+        polars.read_parquet(client.get_object(Bucket='test-bucket', Key=x)['Body'].read())
+        for x in OUTPUT_KEYS
+    ]
+
+
+def test_reparse_matches_stats_run(monkeypatch, boxscore, team, session, s3):
+    """
+    Tests the reparsed files match the files of the stats run
+    """
+
+    client = session.client('s3')
+    stream = BytesIO()
+    polars.read_parquet('./tests/test_files/20241201.parquet').head(3).write_parquet(stream)
+    client.put_object(
+        Bucket='test-bucket', Key='schedule/20241201.parquet', Body=stream.getvalue()
+    )
+
+    monkeypatch.setenv('BASE_URL', '')
+    monkeypatch.setattr(
+        GamePackageService,
+        'get_stats_payload',
+        lambda _, url: boxscore if url.startswith('boxscore') else team,
+    )
+
+    stats_puller.main('test-bucket', 'schedule/20241201.parquet', archive=True)
+
+    archives = client.list_objects_v2(Bucket='test-bucket', Prefix='raw/2025/regular/20241201/')
+    assert_that(archives['KeyCount']).is_equal_to(3)
+
+    expected = _read_outputs(client)
+    for key in OUTPUT_KEYS:
+        client.delete_object(Bucket='test-bucket', Key=key)
+
+    monkeypatch.setattr(GamePackageService, 'get_stats_payload', None)
+    reparse.main('test-bucket', prefix='schedule/', concurrency=4)
+
+    for actual, frame in zip(_read_outputs(client), expected, strict=True):
+        assert_that(actual.equals(frame)).is_true()
+
+
+def test_reparse_no_bucket():
+    """
+    Tests reparsing without a bucket or schedule
+    """
+
+    assert_that(reparse.main).raises(SystemExit).when_called_with('')
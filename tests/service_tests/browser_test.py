@@ -0,0 +1,122 @@
+"""
+Tests for the Browser Pool
+"""
+
+import threading
+
+from assertpy import assert_that
+
+from services.browser import BrowserPool
+from services.stats import BaseService
+
+
+class FakeBrowser:
+    """
+    Stand in for a Chrome Web Driver
+    """
+
+    def __init__(self):
+        self.closed = False
+        self.urls = []
+
+    def get(self, url: str) -> None:
+        self.urls.append(url)
+
+    def execute_script(self, script: str) -> dict:
+        return {'url': self.urls[-1]}
+
+    def quit(self) -> None:
+        self.closed = True
+
+
+def test_checkout_starts_browser():
+    """
+    Tests a browser is started on the first checkout
+    """
+
+    pool = BrowserPool(2, FakeBrowser)
+    assert_that(pool.started).is_equal_to(0)
+
+    browser = pool.checkout()
+    assert_that(browser).is_instance_of(FakeBrowser)
+    assert_that(pool.started).is_equal_to(1)
+
+
+def test_checkin_reuses_browser():
+    """
+    Tests a returned browser is reused by the next checkout
+    """
+
+    pool = BrowserPool(2, FakeBrowser)
+    browser = pool.checkout()
+    pool.checkin(browser)
+
+    assert_that(pool.checkout()).is_same_as(browser)
+    assert_that(pool.started).is_equal_to(1)
+
+
+def test_pool_is_bounded():
+    """
+    Tests the pool does not start more browsers than its size
+    """
+
+    pool = BrowserPool(1, FakeBrowser)
+    pool.checkout()
+
+    assert_that(pool.checkout).raises(TimeoutError).when_called_with(0.01)
+    assert_that(pool.started).is_equal_to(1)
+
+
+def test_checkout_waits_for_checkin():
+    """
+    Tests a blocked checkout receives the returned browser
+    """
+
+    pool = BrowserPool(1, FakeBrowser)
+    browser = pool.checkout()
+    timer = threading.Timer(0.05, pool.checkin, args=[browser])
+    timer.start()
+
+    assert_that(pool.checkout(timeout=5)).is_same_as(browser)
+    timer.join()
+
+
+def test_close_quits_browsers():
+    """
+    Tests closing the pool quits all of the started browsers
+    """
+
+    pool = BrowserPool(2, FakeBrowser)
+    first = pool.checkout()
+    second = pool.checkout()
+    pool.checkin(first)
+    pool.close()
+
+    assert_that([first, second]).extracting('closed').contains_only(True)
+    assert_that(pool.checkout).raises(RuntimeError).when_called_with()
+
+
+def test_invalid_size():
+    """
+    Tests the pool size must be positive
+    """
+
+    assert_that(BrowserPool).raises(ValueError).when_called_with(0)
+
+
+def test_services_share_pool():
+    """
+    Tests services borrow from the provided pool
+    """
+
+    pool = BrowserPool(1, FakeBrowser)
+    first = BaseService('http://localhost/one', pool)
+    second = BaseService('http://localhost/two', pool)
+
+    assert_that(first.get_stats_payload('http://localhost/one')).is_equal_to(
+        {'url': 'http://localhost/one'}
+    )
+    assert_that(second.get_stats_payload('http://localhost/two')).is_equal_to(
+        {'url': 'http://localhost/two'}
+    )
+    assert_that(pool.started).is_equal_to(1)
@@ -0,0 +1,109 @@
+"""
+Tests for the Payload Cache
+"""
+
+import os
+import time
+
+from assertpy import assert_that
+
+from services.cache import PayloadCache
+from services.stats import BaseService
+
+
+def test_cache_round_trip(tmp_path):
+    """
+    Tests storing and reading a payload
+    """
+
+    cache = PayloadCache(str(tmp_path))
+    cache.put('http://localhost/a', {'page': {'content': {}}})
+
+    assert_that(cache.get('http://localhost/a')).is_equal_to({'page': {'content': {}}})
+    assert_that(cache.get('http://localhost/b')).is_none()
+    assert_that(cache.stats()).contains_entry({'hits': 1}, {'misses': 1}, {'entries': 1})
+
+
+def test_cache_persists(tmp_path):
+    """
+    Tests entries are available to a new cache on the same directory
+    """
+
+    PayloadCache(str(tmp_path)).put('http://localhost/a', {'value': 1})
+
+    cache = PayloadCache(str(tmp_path))
+    assert_that(cache.size).is_greater_than(0)
+    assert_that(cache.get('http://localhost/a')).is_equal_to({'value': 1})
+
+
+def test_cache_expired_entry(tmp_path):
+    """
+    Tests an expired entry is treated as a miss and removed
+    """
+
+    cache = PayloadCache(str(tmp_path))
+    cache.put('http://localhost/a', {'value': 1}, ttl=-1)
+
+    assert_that(cache.get('http://localhost/a')).is_none()
+    assert_that(cache.stats()).contains_entry({'misses': 1}, {'entries': 0})
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    """
+    Tests the least recently used entry is evicted when the cache is full
+    """
+
+    cache = PayloadCache(str(tmp_path), max_bytes=10**6)
+    cache.put('http://localhost/a', {'value': 'a'})
+    cache.put('http://localhost/b', {'value': 'b'})
+    old = time.time() - 60
+    os.utime(os.path.join(str(tmp_path), cache._name_('http://localhost/b')), (old, old))
+    os.utime(os.path.join(str(tmp_path), cache._name_('http://localhost/a')), (old - 60, old - 60))
+    cache.get('http://localhost/a')
+
+    cache.max_bytes = cache.size + 1
+    cache.put('http://localhost/c', {'value': 'c'})
+
+    assert_that(cache.get('http://localhost/b')).is_none()
+    assert_that(cache.get('http://localhost/a')).is_equal_to({'value': 'a'})
+    assert_that(cache.get('http://localhost/c')).is_equal_to({'value': 'c'})
+    assert_that(cache.evictions).is_equal_to(1)
+
+
+def test_cache_corrupt_entry(tmp_path):
+    """
+    Tests an unreadable entry is discarded
+    """
+
+    cache = PayloadCache(str(tmp_path))
+    with open(os.path.join(str(tmp_path), cache._name_('http://localhost/a')), 'wb') as output:
+        output.write(b'not gzip')
+
+    assert_that(cache.get('http://localhost/a')).is_none()
+
+
+def test_service_uses_cache(tmp_path, monkeypatch, team, schedule):
+    """
+    Tests the service caches final games forever and other pages with the default ttl
+    """
+
+    cache = PayloadCache(str(tmp_path), default_ttl=120)
+    service = BaseService('http://localhost', cache=cache)
+    calls = []
+
+    def _mock_fetch(url: str) -> dict:
+        calls.append(url)
+        return team if 'matchup' in url else schedule
+
+    monkeypatch.setattr(service, '_fetch_payload_', _mock_fetch)
+    puts = []
+    original_put = cache.put
+    monkeypatch.setattr(cache, 'put', lambda *args: puts.append(args[2]) or original_put(*args))
+
+    service.get_stats_payload('http://localhost/matchup')
+    service.get_stats_payload('http://localhost/matchup')
+    service.get_stats_payload('http://localhost/schedule')
+
+    assert_that(calls).is_equal_to(['http://localhost/matchup', 'http://localhost/schedule'])
+    assert_that(puts).is_equal_to([None, 120])
+    assert_that(cache.hits).is_equal_to(1)
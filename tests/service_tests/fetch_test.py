@@ -0,0 +1,118 @@
+"""
+Tests for the browser-less HTTP fetch engine
+"""
+
+from assertpy import assert_that
+
+from services.browser import BrowserPool
+from services.fetch import HttpFetcher, extract_payload
+from services.stats import BaseService, PlayerService, ScheduleService
+
+
+class FallbackBrowser:
+    """
+    Stand in for a Chrome Web Driver
+    """
+
+    def get(self, url: str) -> None:
+        pass
+
+    def execute_script(self, script: str) -> dict:
+        return {'source': 'browser'}
+
+    def quit(self) -> None:
+        pass
+
+
+def test_extract_payload_bracket_assignment():
+    """
+    Tests extracting a payload assigned with bracket notation
+    """
+
+    html = '<script>window[\'__espnfitt__\']={"page": {"content": {}}};</script>'
+    assert_that(extract_payload(html)).is_equal_to({'page': {'content': {}}})
+
+
+def test_extract_payload_dot_assignment():
+    """
+    Tests extracting a payload assigned with dot notation
+    """
+
+    html = '<script>window.__espnfitt__ = {"page": {"title": "a</b>"}}</script><p>{}</p>'
+    assert_that(extract_payload(html)).is_equal_to({'page': {'title': 'a</b>'}})
+
+
+def test_extract_payload_missing():
+    """
+    Tests a page without a payload
+    """
+
+    assert_that(extract_payload('<html><body></body></html>')).is_none()
+
+
+def test_extract_payload_invalid():
+    """
+    Tests a page with a truncated payload
+    """
+
+    assert_that(extract_payload('<script>window.__espnfitt__={"page": ')).is_none()
+
+
+def test_fetch_payload(stats_site, boxscore):
+    """
+    Tests retrieving the payload from the page source
+    """
+
+    fetcher = HttpFetcher()
+    result = fetcher.get_stats_payload(f'{stats_site}/boxscore/_/gameId/401713576')
+    assert_that(result).is_equal_to(boxscore)
+
+
+def test_fetch_not_found(stats_site):
+    """
+    Tests retrieving a page that does not exist
+    """
+
+    fetcher = HttpFetcher(retries=0)
+    assert_that(fetcher.get_stats_payload(f'{stats_site}/missing')).is_none()
+
+
+def test_player_service_http_engine(stats_site):
+    """
+    Tests the Player Service using the http engine
+    """
+
+    service = PlayerService(stats_site, BrowserPool(1, FallbackBrowser), engine='http')
+    result = service.get_stats('401713576')
+    assert_that(result).is_not_empty()
+    assert_that(result).extracting('game_id').contains_only('401713576')
+
+
+def test_schedule_service_http_engine(stats_site):
+    """
+    Tests the Schedule Service using the http engine
+    """
+
+    service = ScheduleService(stats_site, BrowserPool(1, FallbackBrowser), engine='http')
+    assert_that(service.get_schedule(date='20241202')).is_not_empty()
+
+
+def test_http_engine_falls_back_to_browser(stats_site):
+    """
+    Tests the browser is used when the payload cannot be extracted
+    """
+
+    pool = BrowserPool(1, FallbackBrowser)
+    service = BaseService(stats_site, pool, engine='http')
+
+    result = service.get_stats_payload(f'{stats_site}/broken/page')
+    assert_that(result).is_equal_to({'source': 'browser'})
+    assert_that(pool.started).is_equal_to(1)
+
+
+def test_unknown_engine():
+    """
+    Tests an unknown engine is rejected
+    """
+
+    assert_that(BaseService).raises(ValueError).when_called_with('http://localhost', engine='curl')
@@ -0,0 +1,59 @@
+"""
+Tests for the Game Package Service
+"""
+
+from assertpy import assert_that
+
+from services.stats import GamePackageService, GameService, PlayerService, TeamService
+
+
+def test_get_game_package(monkeypatch, boxscore, team):
+    """
+    Tests retrieving the players, teams and game info with one load per page
+    """
+
+    urls = []
+
+    def _mock_payload(url: str) -> dict:
+        urls.append(url)
+        return boxscore if '/boxscore/' in url else team
+
+    service = GamePackageService('http://localhost/package')
+    monkeypatch.setattr(service, 'get_stats_payload', _mock_payload)
+
+    result = service.get_game_package('401713576')
+
+    assert_that(urls).is_length(2)
+    assert_that(result.players).is_equal_to(PlayerService.parse_stats('401713576', boxscore))
+    assert_that(result.teams).is_equal_to(TeamService.parse_stats(team))
+    assert_that(result.game).is_equal_to(GameService.parse_game_info('401713576', team))
+
+
+def test_get_game_package_no_payload(monkeypatch):
+    """
+    Tests retrieving the Game Package without payloads
+    """
+
+    service = GamePackageService('http://localhost/package')
+    monkeypatch.setattr(service, 'get_stats_payload', lambda *args: None)
+
+    result = service.get_game_package('401713576')
+    assert_that(result.players).is_empty()
+    assert_that(result.teams).is_empty()
+    assert_that(result.game).is_none()
+
+
+def test_get_game_package_game_from_matchup(monkeypatch, team):
+    """
+    Tests the game info is taken from the matchup page when the boxscore has none
+    """
+
+    service = GamePackageService('http://localhost/package')
+    monkeypatch.setattr(
+        service, 'get_stats_payload', lambda url: None if '/boxscore/' in url else team
+    )
+
+    result = service.get_game_package('401713576')
+    assert_that(result.players).is_empty()
+    assert_that(result.teams).is_not_empty()
+    assert_that(result.game).has_game_id('401713576').has_home_score(68)
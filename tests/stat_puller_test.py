@@ -2,24 +2,34 @@
 Tests for the Stat Puller
 """
 
+import random
+import time
+
+import polars
 from assertpy import assert_that
 from polars import DataFrame
 
 import stats_puller
-from data.entities import Schedule
-from services.stats import GameService, PlayerService, TeamService
+from data.entities import Game, GamePackage, PlayerStatistic, Schedule, TeamStatistic
+from services.stats import GamePackageService
 from stats_puller import ClientError
 
 
+def _payloads(boxscore: dict, team: dict):
+    """
+    Returns the boxscore or matchup payload based on the requested page
+    """
+
+    return lambda _, url: boxscore if url.startswith('boxscore') else team
+
+
 def test_pull_stats(monkeypatch, boxscore, team, session, schedule_file):
     """
     Tests Pulling stats for a schedule file
     """
 
     monkeypatch.setenv('BASE_URL', '')
-    monkeypatch.setattr(PlayerService, 'get_stats_payload', lambda *args: boxscore)
-    monkeypatch.setattr(TeamService, 'get_stats_payload', lambda *args: team)
-    monkeypatch.setattr(GameService, 'get_stats_payload', lambda *args: team)
+    monkeypatch.setattr(GamePackageService, 'get_stats_payload', _payloads(boxscore, team))
 
     stats_puller.main('test-bucket', 'schedule/20241201.parquet')
 
@@ -32,15 +42,63 @@ def test_pull_stats(monkeypatch, boxscore, team, session, schedule_file):
     assert_that(response['Contents']).is_not_empty()
 
 
+def test_pull_stats_concurrency(monkeypatch, boxscore, team, session, schedule_file):
+    """
+    Tests Pulling stats for a schedule file with several workers
+    """
+
+    monkeypatch.setenv('BASE_URL', '')
+    monkeypatch.setattr(GamePackageService, 'get_stats_payload', _payloads(boxscore, team))
+
+    stats_puller.main('test-bucket', 'schedule/20241201.parquet', concurrency=4)
+
+    client = session.client('s3')
+    response = client.get_object(
+        Bucket='test-bucket', Key='games/2025/regular/games-20241201.parquet'
+    )
+    frame = polars.read_parquet(response['Body'].read())
+    assert_that(frame.height).is_equal_to(146)
+
+
+def _delayed_game_package(self, game_id: str) -> GamePackage:
+    time.sleep(random.uniform(0, 0.01))
+    if game_id == 'bad':
+        raise ValueError('Renderer crashed')
+    return GamePackage(
+        players=[PlayerStatistic(game_id=game_id, statistic_name='points')],
+        teams=[TeamStatistic(game_id=game_id)],
+        game=Game(game_id=game_id),
+    )
+
+
+def test_pull_games_keeps_order(monkeypatch):
+    """
+    Tests concurrent results keep the schedule order and skip failed games
+    """
+
+    monkeypatch.setattr(GamePackageService, 'get_game_package', _delayed_game_package)
+
+    game_ids = [str(x) for x in range(20)]
+    schedules = [Schedule(game_id=x, year=2025, game_type=2) for x in [*game_ids[:5], 'bad']]
+    schedules.extend([Schedule(game_id=x, year=2025, game_type=2) for x in game_ids[5:]])
+
+    players, games, teams = stats_puller.pull_games(
+        schedules, GamePackageService(''), concurrency=4
+    )
+
+    assert_that([x.game_id for x in players]).is_equal_to(game_ids)
+    assert_that([x.game_id for x in games]).is_equal_to(game_ids)
+    assert_that([x.game_id for x in teams]).is_equal_to(game_ids)
+    assert_that(players).extracting('year').contains_only(2025)
+
+
 def test_pull_schedule_failure(monkeypatch, boxscore, team, session, schedule_file):
     """
     Tests failing to find the schedule file
     """
 
     monkeypatch.setenv('BASE_URL', '')
-    monkeypatch.setattr(PlayerService, 'get_stats_payload', lambda *args: boxscore)
-    monkeypatch.setattr(TeamService, 'get_stats_payload', lambda *args: team)
-    monkeypatch.setattr(GameService, 'get_stats_payload', lambda *args: team)
+    monkeypatch.setattr(GamePackageService, 'get_stats_payload', _payloads(boxscore, team))
 
     assert_that(stats_puller.main).raises(ClientError).when_called_with(
         'test-bucket-2', 'schedule/20241201.parquet'
@@ -53,9 +111,7 @@ def test_write_failure(monkeypatch, boxscore, team, session, schedule_file):
     """
 
     monkeypatch.setenv('BASE_URL', '')
-    monkeypatch.setattr(PlayerService, 'get_stats_payload', lambda *args: boxscore)
-    monkeypatch.setattr(TeamService, 'get_stats_payload', lambda *args: team)
-    monkeypatch.setattr(GameService, 'get_stats_payload', lambda *args: team)
+    monkeypatch.setattr(GamePackageService, 'get_stats_payload', _payloads(boxscore, team))
     monkeypatch.setattr(
         stats_puller, 'load_schedule', lambda *args: DataFrame([Schedule(game_id='12345')])
     )